@@ -8,30 +8,97 @@ Supports BOTH:
 """
 
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+from functools import lru_cache
+
+
+def _find_env_file(name: str = ".env"):
+    """Walk up from this package to the filesystem root looking for .env."""
+    path = os.path.dirname(os.path.abspath(__file__))
+    while True:
+        candidate = os.path.join(path, name)
+        if os.path.isfile(candidate):
+            return candidate
+        parent = os.path.dirname(path)
+        if parent == path:
+            return None
+        path = parent
+
+
+def _fast_parse_env(path) -> dict:
+    """
+    Minimal KEY=VALUE reader for .env files (read once, no regex).
+    Skips blank lines and # comments, strips `export `, surrounding
+    quotes and trailing ` # comments` (after quoted values too).
+    """
+    parsed = {}
+    if not path:
+        return parsed
+    try:
+        with open(path, encoding="utf-8") as f:
+            text = f.read()
+    except OSError:
+        return parsed
+
+    for line in text.split("\n"):
+        line = line.strip()
+        if not line or line[0] == "#":
+            continue
+        k, sep, v = line.partition("=")
+        if not sep:
+            continue
+        k = k.strip()
+        if k.startswith("export "):
+            k = k[7:].strip()
+        v = v.strip()
+        # Like python-dotenv: a quoted value ends at its closing quote (a
+        # trailing " # comment" is dropped, a "#" inside the quotes kept);
+        # an unquoted value ends at " #". Not supported: multi-line values,
+        # escape sequences inside double quotes, and ${VAR} expansion.
+        end = v.find(v[0], 1) if v and v[0] in "\"'" else -1
+        if end > 0:
+            v = v[1:end]
+        else:
+            v = v.split(" #", 1)[0].rstrip()
+        parsed[k] = v
+    return parsed
+
+
+# Real environment wins over .env (same precedence as load_dotenv())
+_PARSED = _fast_parse_env(_find_env_file())
+for _k, _v in _PARSED.items():
+    os.environ.setdefault(_k, _v)
+_ENV = {**_PARSED, **os.environ}
+
+# Every env key load_settings() reads (one per Settings field)
+_KEYS = (
+    "API_KEY", "API_SECRET", "API_PASSPHRASE", "PRIVATE_KEY",
+    "SIGNATURE_TYPE", "FUNDER", "MARKET_KEYWORD", "ORDER_SIZE",
+    "TARGET_PAIR_COST", "COOLDOWN_SECONDS", "DRY_RUN", "VERBOSE",
+    "USE_RICH_OUTPUT", "USE_WSS", "MAX_DAILY_LOSS", "MAX_POSITION_SIZE",
+    "MAX_TRADES_PER_DAY", "MIN_BALANCE_REQUIRED", "MAX_BALANCE_UTILIZATION",
+    "ENABLE_STATS", "TRADE_LOG_FILE", "SIM_BALANCE", "WS_URL",
+    "WS_COMPRESSION",
+)
+
+# Auto fallback mapping (API_KEY → POLYMARKET_API_KEY), built once
+_ALIASES = {k: "POLYMARKET_" + k for k in _KEYS}
 
-from dotenv import load_dotenv
 
-load_dotenv()
+def _get(key: str, default=None):
+    """Fetch from .env, supporting fallback POLYMARKET_ keys (KeyError on unknown key)."""
+    return _ENV.get(key) or _ENV.get(_ALIASES[key]) or default
 
 
-def _get(key: str, default=None):
-    """Fetch from .env, supporting fallback POLYMARKET_ keys."""
-    # Primary key
-    v = os.getenv(key)
-    if v not in (None, ""):
-        return v
+_TRUE = frozenset({"true", "True", "TRUE", "1", "yes", "Yes", "YES", "on", "On", "ON"})
 
-    # Auto fallback mapping (API_KEY → POLYMARKET_API_KEY)
-    pm_key = f"POLYMARKET_{key}"
-    v2 = os.getenv(pm_key)
-    if v2 not in (None, ""):
-        return v2
 
-    return default
+def _as_bool(v, default=False) -> bool:
+    """Parse an env flag without allocating a lowercased copy."""
+    return (v in _TRUE) if v else default
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Settings:
     # Core creds
     api_key: str
@@ -69,9 +136,18 @@ class Settings:
 
     # Websocket
     ws_url: str
+    ws_compression: bool
+
+
+# Fail at import, not mid-run, if _KEYS and Settings drift apart
+if {k.lower() for k in _KEYS} != {f.name for f in fields(Settings)}:
+    raise RuntimeError("config._KEYS does not match the Settings fields")
 
 
+@lru_cache(maxsize=None)
 def load_settings():
+    # _ENV is snapshotted at import and Settings is frozen, so one shared
+    # instance is safe to hand out to every caller.
     return Settings(
         # --- credentials (support dual names) ---
         api_key=_get("API_KEY", ""),
@@ -89,10 +165,10 @@ def load_settings():
         cooldown_seconds=int(_get("COOLDOWN_SECONDS", 2)),
 
         # --- mode flags ---
-        dry_run=_get("DRY_RUN", "True").lower() == "true",
-        verbose=_get("VERBOSE", "False").lower() == "true",
-        use_rich_output=_get("USE_RICH_OUTPUT", "False").lower() == "true",
-        use_wss=_get("USE_WSS", "False").lower() == "true",
+        dry_run=_as_bool(_get("DRY_RUN"), True),
+        verbose=_as_bool(_get("VERBOSE"), False),
+        use_rich_output=_as_bool(_get("USE_RICH_OUTPUT"), False),
+        use_wss=_as_bool(_get("USE_WSS"), False),
 
         # --- risk ---
         max_daily_loss=float(_get("MAX_DAILY_LOSS", 0)),
@@ -102,10 +178,11 @@ def load_settings():
         max_balance_utilization=float(_get("MAX_BALANCE_UTILIZATION", 1.0)),
 
         # --- stats ---
-        enable_stats=_get("ENABLE_STATS", "False").lower() == "true",
+        enable_stats=_as_bool(_get("ENABLE_STATS"), False),
         trade_log_file=_get("TRADE_LOG_FILE", "trade_log.csv"),
         sim_balance=float(_get("SIM_BALANCE", 100.0)),
 
         # --- Websocket ---
         ws_url=_get("WS_URL", "wss://clob.polymarket.com/ws"),
+        ws_compression=_as_bool(_get("WS_COMPRESSION"), False),
     )
@@ -12,13 +12,6 @@ import logging
 import sys
 from typing import Optional
 
-try:
-    from rich.logging import RichHandler
-    RICH_AVAILABLE = True
-except Exception:
-    RICH_AVAILABLE = False
-
-
 def setup_logging(
     verbose: bool = False,
     use_rich: bool = True,
@@ -40,9 +33,18 @@ def setup_logging(
 
     handlers = []
 
-    if use_rich and RICH_AVAILABLE:
+    # rich is heavy to import; only pay for it when it was asked for
+    rich_handler = None
+    if use_rich:
+        try:
+            from rich.logging import RichHandler
+            rich_handler = RichHandler
+        except Exception:
+            pass
+
+    if rich_handler is not None:
         handlers.append(
-            RichHandler(
+            rich_handler(
                 rich_tracebacks=True,
                 tracebacks_show_locals=False,
                 markup=True,
@@ -57,26 +59,32 @@ def setup_logging(
     logging.basicConfig(
         level=level,
         handlers=handlers,
-        format="%(message)s" if (use_rich and RICH_AVAILABLE) else "%(asctime)s %(levelname)s %(message)s",
+        format="%(message)s" if rich_handler is not None else "%(asctime)s %(levelname)s %(message)s",
     )
 
     logger = logging.getLogger(__name__)
-    logger.debug("Logging initialized (rich=%s, verbose=%s)", use_rich and RICH_AVAILABLE, verbose)
+    logger.debug("Logging initialized (rich=%s, verbose=%s)", rich_handler is not None, verbose)
 
 
 def print_header(msg: str):
     """Top-level bold header."""
     bar = "─" * max(40, len(msg))
-    logging.info(f"\n{bar}\n{msg}\n{bar}\n")
+    logging.info("\n%s\n%s\n%s\n", bar, msg, bar)
+
 
+# print_* take %-style args like logging itself: the message is only
+# formatted when the level is enabled, e.g. print_error("Bad %s", key)
 
-def print_success(msg: str):
-    logging.info(f"✅ {msg}")
+def print_success(msg: str, *args):
+    if logging.root.isEnabledFor(logging.INFO):
+        logging.info("✅ " + msg, *args)
 
 
-def print_error(msg: str):
-    logging.error(f"❌ {msg}")
+def print_error(msg: str, *args):
+    if logging.root.isEnabledFor(logging.ERROR):
+        logging.error("❌ " + msg, *args)
 
 
-def print_warning(msg: str):
-    logging.warning(f"⚠️ {msg}")
+def print_warning(msg: str, *args):
+    if logging.root.isEnabledFor(logging.WARNING):
+        logging.warning("⚠️ " + msg, *args)
@@ -5,23 +5,60 @@ Auto-market discovery with keyword matching & retry loop
 
 import time
 import logging
+from itertools import islice
 import httpx
 
+from .utils import json_loads
+
 logger = logging.getLogger(__name__)
 
 CLOB_MARKETS_URL = "https://clob.polymarket.com/markets"
 
+# One pooled HTTP/2 connection for all discovery calls (no TLS handshake per poll)
+_CLIENT = httpx.Client(
+    http2=True,
+    timeout=15.0,
+    limits=httpx.Limits(max_keepalive_connections=4),
+)
+
+# Market list is re-used for this many seconds before hitting the API again
+MARKETS_CACHE_TTL = 15.0
+
+# (fetched_at, markets, [(question_lower, slug, tokens), ...])
+# The index is filled lazily by find_market_by_keyword(), so an early
+# match never lowercases the rest of the list.
+_markets_cache = (0.0, [], [])
+
+
+def _index_market(m) -> tuple:
+    """Normalize one market into (question_lower, slug, tokens)."""
+    # m 可能是字符串 slug，也可能是字典
+    if isinstance(m, dict):
+        return str(m.get("question", "")).lower(), m.get("slug"), m.get("tokens", [])
+    # m 是字符串 slug，没有 token 信息，自动填空
+    return m.lower(), m, []
+
 
 def fetch_all_markets() -> list:
-    """Fetch all markets from CLOB; return [] if error."""
+    """Fetch all markets from CLOB (cached for MARKETS_CACHE_TTL); return [] if error."""
+    global _markets_cache
+
+    fetched_at, markets, _ = _markets_cache
+    if markets and time.time() - fetched_at < MARKETS_CACHE_TTL:
+        return markets
+
     try:
-        resp = httpx.get(CLOB_MARKETS_URL, timeout=15)
+        resp = _CLIENT.get(CLOB_MARKETS_URL)
         resp.raise_for_status()
-        return resp.json()
+        markets = json_loads(resp.content)
     except Exception as e:
         logger.error(f"Error fetching markets: {e}")
         return []
 
+    if markets:
+        _markets_cache = (time.time(), markets, [])
+    return markets
+
 
 def find_market_by_keyword(keyword: str):
     """
@@ -36,29 +73,20 @@ def find_market_by_keyword(keyword: str):
     if not markets:
         return None
 
-    matches = []
-
-    for m in markets:
-        # m 可能是字符串 slug，也可能是字典
-        if isinstance(m, dict):
-            q = str(m.get("question", "")).lower()
-            tokens = m.get("tokens", [])
-            slug = m.get("slug")
-        else:
-            # m 是字符串 slug
-            q = m.lower()
-            tokens = []   # 没有 token 信息，自动填空
-            slug = m
-
+    # pick the first: reuse entries lowered by earlier calls, then extend
+    index = _markets_cache[2]
+    for q, slug, tokens in index:
         if keyword in q:
-            matches.append({"slug": slug, "question": q, "tokens": tokens})
-
-    if not matches:
-        return None
+            return {"slug": slug, "question": q, "tokens": tokens}
 
-    # pick the first
-    return matches[0]
+    for m in islice(markets, len(index), None):
+        entry = _index_market(m)
+        index.append(entry)
+        if keyword in entry[0]:
+            q, slug, tokens = entry
+            return {"slug": slug, "question": q, "tokens": tokens}
 
+    return None
 
 
 def auto_wait_market(keyword: str, retry_seconds=30, max_wait=None):
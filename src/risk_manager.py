@@ -12,41 +12,56 @@ Features:
 ✔ Zero-runtime errors when limits unset
 """
 
+import math
+import time
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 
+SECONDS_PER_DAY = 86400
+
+
+def _epoch_day() -> int:
+    """Current UTC day as days since the epoch (cheap to compare)."""
+    return int(time.time() // SECONDS_PER_DAY)
+
 
 @dataclass
 class RiskLimits:
-    max_daily_loss: Optional[float] = None        # Stop if netPnL < -max_loss
-    max_trades_per_day: Optional[int] = None     # Block trades after hitting limit
-    max_position_size: Optional[float] = None    # Per-trade cap
+    max_daily_loss: Optional[float] = None        # Stop if netPnL < -max_loss (None/0 = off)
+    max_trades_per_day: Optional[int] = None     # Block trades after hitting limit (None/0 = off)
+    max_position_size: Optional[float] = None    # Per-trade cap (None/0 = off)
     min_balance_required: float = 0.0             # Must hold at least this much USDC
     max_balance_utilization: float = 1.0          # 0.5 => never spend >50% of wallet per trade
 
 
-@dataclass
-class DailyRiskState:
-    date: str
-    trades_count: int = 0
-    net_pnl: float = 0.0  # running PnL (expected or realized)
-    invested: float = 0.0
-
-
 class RiskManager:
     def __init__(self, limits: RiskLimits):
         self.limits = limits
-        today = datetime.utcnow().strftime("%Y-%m-%d")
-        self.state = DailyRiskState(date=today)
+        self._reset_day(_epoch_day())
+
+        # Resolve limits once; unset limits become +/-inf so can_trade()
+        # needs no None checks.
+        self._min_balance = float(limits.min_balance_required or 0.0)
+        self._util = float(limits.max_balance_utilization)
+        self._max_trades = limits.max_trades_per_day or math.inf
+        self._max_pos = float(limits.max_position_size or math.inf)
+        self._loss_floor = -abs(float(limits.max_daily_loss)) if limits.max_daily_loss else -math.inf
 
     # -----------------------------------------------------------
     # HELPER: Day Reset
     # -----------------------------------------------------------
+    def _reset_day(self, day: int):
+        # Daily state lives directly on the manager (no per-day object)
+        self._date = day  # UTC epoch day, see _epoch_day()
+        self._trades_count = 0
+        self._net_pnl = 0.0  # running PnL (expected or realized)
+        self._invested = 0.0
+
     def _rollover_if_needed(self):
-        today = datetime.utcnow().strftime("%Y-%m-%d")
-        if self.state.date != today:
-            self.state = DailyRiskState(date=today)
+        today = _epoch_day()
+        if self._date != today:
+            self._reset_day(today)
 
     # -----------------------------------------------------------
     # MAIN CHECK
@@ -60,43 +75,25 @@ class RiskManager:
         self._rollover_if_needed()
 
         # Require minimum balance
-        if current_balance < self.limits.min_balance_required:
-            return False, (
-                f"Balance too low: {current_balance:.2f} < "
-                f"{self.limits.min_balance_required:.2f}"
-            )
+        if current_balance < self._min_balance:
+            return False, f"Balance too low: {current_balance:.2f} < {self._min_balance:.2f}"
 
         # Max utilization guard
-        max_spend = current_balance * float(self.limits.max_balance_utilization)
+        max_spend = current_balance * self._util
         if trade_size > max_spend:
-            return False, (
-                f"Trade cost {trade_size:.2f} > utilization "
-                f"limit {max_spend:.2f}"
-            )
+            return False, f"Trade cost {trade_size:.2f} > utilization limit {max_spend:.2f}"
 
         # Max trades/day
-        if self.limits.max_trades_per_day is not None:
-            if self.state.trades_count >= self.limits.max_trades_per_day:
-                return False, (
-                    f"Hit daily trade cap "
-                    f"{self.state.trades_count}/{self.limits.max_trades_per_day}"
-                )
+        if self._trades_count >= self._max_trades:
+            return False, f"Hit daily trade cap {self._trades_count}/{self._max_trades}"
 
         # Per trade max position
-        if self.limits.max_position_size is not None:
-            if trade_size > self.limits.max_position_size:
-                return False, (
-                    f"Trade too large: {trade_size:.2f} > "
-                    f"{self.limits.max_position_size:.2f}"
-                )
+        if trade_size > self._max_pos:
+            return False, f"Trade too large: {trade_size:.2f} > {self._max_pos:.2f}"
 
         # Daily loss stop
-        if self.limits.max_daily_loss is not None:
-            if self.state.net_pnl < -abs(self.limits.max_daily_loss):
-                return False, (
-                    f"Daily PnL {self.state.net_pnl:.2f} < "
-                    f"limit -{abs(self.limits.max_daily_loss):.2f}"
-                )
+        if self._net_pnl < self._loss_floor:
+            return False, f"Daily PnL {self._net_pnl:.2f} < limit {self._loss_floor:.2f}"
 
         return True, ""
 
@@ -109,8 +106,8 @@ class RiskManager:
         Profit passed here is EXPECTED profit until the market settles.
         """
         self._rollover_if_needed()
-        self.state.trades_count += 1
-        self.state.net_pnl += profit
+        self._trades_count += 1
+        self._net_pnl += profit
 
     # Optionally replace expected PnL with actual resolution
     def adjust_actual_pnl(self, realized_profit: float):
@@ -118,7 +115,7 @@ class RiskManager:
         Call this when a market resolves.
         """
         self._rollover_if_needed()
-        self.state.net_pnl += realized_profit
+        self._net_pnl += realized_profit
 
     # -----------------------------------------------------------
     # EXTERNAL SNAPSHOT
@@ -129,7 +126,9 @@ class RiskManager:
         """
         self._rollover_if_needed()
         return {
-            "date": self.state.date,
-            "trades": self.state.trades_count,
-            "net_pnl": self.state.net_pnl,
+            "date": datetime.fromtimestamp(
+                self._date * SECONDS_PER_DAY, tz=timezone.utc
+            ).strftime("%Y-%m-%d"),
+            "trades": self._trades_count,
+            "net_pnl": self._net_pnl,
         }
@@ -11,38 +11,70 @@ Enhanced by ChatGPT:
 
 import asyncio
 import logging
+import sys
 import time
-from datetime import datetime
 from typing import Optional
 
+import numpy as np
+
 from .config import load_settings
 from .config_validator import ConfigValidator
 from .logger import setup_logging, print_header, print_error
 from .risk_manager import RiskManager, RiskLimits
 from .statistics import StatisticsTracker
 from .trading import (
-    get_client, place_order, cancel_orders, get_positions,
+    get_client, get_async_client, place_order, cancel_orders, get_positions,
     place_orders_fast, extract_order_id, wait_for_terminal_order,
     has_redeemable, redeem_all,
 )
-from .utils import GracefulShutdown
+from .utils import GracefulShutdown, json_loads
 from .lookup import auto_wait_market
-from .wss_market import MarketWssClient
+from .wss_market import MarketWssClient, OrderEventsClient
 
 logger = logging.getLogger(__name__)
 
+# Wallet balance is re-used for this many seconds before re-fetching
+BALANCE_CACHE_TTL = 5.0
+
+# Fee/slippage buffer applied to the raw YES+NO cost (0.4%)
+COST_BUFFER_MULT = 1.004
+
+# Seconds between background checks for redeemable positions
+REDEEM_CHECK_INTERVAL = 60.0
+
+
+def _levels_array(levels) -> np.ndarray:
+    """
+    Convert book levels ({"px", "sz"} dicts or (px, sz) pairs) into an
+    (N, 2) float64 array of [price, size] rows.
+    """
+    if not levels:
+        return np.empty((0, 2), dtype=np.float64)
+    if isinstance(levels[0], dict):
+        levels = [(lvl["px"], lvl["sz"]) for lvl in levels]
+    return np.asarray(levels, dtype=np.float64).reshape(-1, 2)
+
 
 class SimpleArbitrageBot:
     def __init__(self, settings):
         self.settings = settings
         self.client = get_client(settings)
 
+        # Hot-path copies of (frozen) settings, read on every tick
+        self._order_size = float(settings.order_size)
+        self._target_pair_cost = float(settings.target_pair_cost)
+        self._cooldown = float(settings.cooldown_seconds)
+        self._ws_compression = "deflate" if settings.ws_compression else None
+        self.async_client = get_async_client(settings)
+
         # Stats
         self.trades_executed = 0
         self.positions = []
         self.total_invested = 0.0
         self.total_shares_bought = 0
         self.cached_balance = None
+        self._balance_ts = 0.0
+        self._books = {}
 
         # Risk & tracking
         self.risk_manager = RiskManager(
@@ -56,7 +88,8 @@ class SimpleArbitrageBot:
         )
 
         self.fail_count = 0
-        self._last_execution_ts = 0.0
+        self._redeem_lock = asyncio.Lock()
+        self._last_execution_ts = float("-inf")  # time.monotonic() of last execution
 
         # Market lookup
 
@@ -65,64 +98,98 @@ class SimpleArbitrageBot:
         self.yes_token_id = mkt["yes_token_id"]
         self.no_token_id = mkt["no_token_id"]
 
+        # Arbitrage always submits BUY YES + BUY NO; only price/size change.
+        # place_orders_fast() copies fields out, so the template is reused.
+        self._order_tmpl = [
+            {"side": "BUY", "token_id": self.yes_token_id, "price": 0.0, "size": 0.0},
+            {"side": "BUY", "token_id": self.no_token_id, "price": 0.0, "size": 0.0},
+        ]
+
         if settings.dry_run:
-            self.sim_balance = float(settings.sim_start_balance)
+            self.sim_balance = float(settings.sim_balance)
+
+        # Live WSS mode: order fills are pushed instead of polled
+        self.order_events = None
+        if settings.use_wss and not settings.dry_run:
+            self.order_events = OrderEventsClient(
+                ws_base_url=settings.ws_url,
+                auth={
+                    "apiKey": settings.api_key,
+                    "secret": settings.api_secret,
+                    "passphrase": settings.api_passphrase,
+                },
+                compression=self._ws_compression,
+            ).start()
 
     def get_balance(self):
-        if self.cached_balance is not None:
+        now = time.time()
+        if self.cached_balance is not None and now - self._balance_ts < BALANCE_CACHE_TTL:
             return self.cached_balance
-        wallets = self.client.get("/wallet").json()
-        return float(wallets["balances"].get("USDC", 0))
+        wallets = json_loads(self.client.get("/wallet").content)
+        self.cached_balance = float(wallets["balances"].get("USDC", 0))
+        self._balance_ts = now
+        return self.cached_balance
 
-    def get_order_book(self, token_id):
-        res = self.client.get(f"/orderbook/{token_id}").json()
+    @staticmethod
+    def _parse_order_book(res):
         return {
-            "asks": res.get("asks", []),
-            "bids": res.get("bids", []),
+            "asks": _levels_array(res.get("asks")),
+            "bids": _levels_array(res.get("bids")),
             "best_bid": res.get("bestBid"),
             "best_ask": res.get("bestAsk"),
         }
 
+    def get_order_book(self, token_id):
+        res = json_loads(self.client.get(f"/orderbook/{token_id}").content)
+        return self._parse_order_book(res)
+
+    async def get_order_book_async(self, token_id):
+        resp = await self.async_client.get(f"/orderbook/{token_id}")
+        return self._parse_order_book(json_loads(resp.content))
+
+    async def fetch_books_async(self):
+        """Fetch YES and NO books concurrently (one RTT instead of two)."""
+        return await asyncio.gather(
+            self.get_order_book_async(self.yes_token_id),
+            self.get_order_book_async(self.no_token_id),
+        )
+
     def _compute_buy_fill(self, asks, size):
-        filled = 0
-        cost = 0.0
-        worst = None
-        for lvl in asks:
-            px = float(lvl["px"])
-            sz = float(lvl["sz"])
-            take = min(size - filled, sz)
-            filled += take
-            cost += take * px
-            worst = px
-            if filled >= size:
-                break
-        if filled < size:
+        """(worst, vwap) to buy `size` from an (N, 2) [px, sz] asks array, or None."""
+        cum = np.cumsum(asks[:, 1])
+        idx = int(np.searchsorted(cum, size))
+        if idx == len(cum):
             return None
-        return {
-            "vwap": cost / size,
-            "worst": worst,
-        }
-
-    def check_arbitrage(self, up_book=None, down_book=None):
-        up_book = up_book or self.get_order_book(self.yes_token_id)
-        down_book = down_book or self.get_order_book(self.no_token_id)
-
-        asks_up = up_book.get("asks", [])
-        asks_down = down_book.get("asks", [])
-
-        size = float(self.settings.order_size)
-        fill_up = self._compute_buy_fill(asks_up, size)
-        fill_down = self._compute_buy_fill(asks_down, size)
-        if not fill_up or not fill_down:
+        filled_before = cum[idx - 1] if idx else 0.0
+        worst = float(asks[idx, 0])
+        cost = float(asks[:idx, 0] @ asks[:idx, 1]) + (size - filled_before) * worst
+        return worst, cost / size
+
+    def _compute_pair_fill(self, asks_up, asks_down, size):
+        """(worst_up, worst_down, vwap_up, vwap_down), or None if either side is too thin."""
+        up = self._compute_buy_fill(asks_up, size)
+        if up is None:
+            return None
+        down = self._compute_buy_fill(asks_down, size)
+        if down is None:
+            return None
+        return up[0], down[0], up[1], down[1]
+
+    def check_arbitrage(self, up_book, down_book):
+        """
+        Price the YES/NO pair from already-fetched books.
+        Never does I/O: callers pass REST or WSS books explicitly.
+        """
+        size = self._order_size
+        fill = self._compute_pair_fill(up_book["asks"], down_book["asks"], size)
+        if fill is None:
             return None
 
-        price_up = fill_up["worst"]
-        price_down = fill_down["worst"]
+        price_up, price_down, vwap_up, vwap_down = fill
         raw_cost = price_up + price_down
-        buffer = 0.004
-        adj_cost = raw_cost * (1 + buffer)
+        adj_cost = raw_cost * COST_BUFFER_MULT
 
-        if adj_cost > self.settings.target_pair_cost:
+        if adj_cost > self._target_pair_cost:
             return None
 
         expected_payout = size * 2
@@ -132,8 +199,8 @@ class SimpleArbitrageBot:
         return {
             "price_up": price_up,
             "price_down": price_down,
-            "vwap_up": fill_up["vwap"],
-            "vwap_down": fill_down["vwap"],
+            "vwap_up": vwap_up,
+            "vwap_down": vwap_down,
             "raw_cost": raw_cost,
             "total_cost": adj_cost,
             "order_size": size,
@@ -141,19 +208,24 @@ class SimpleArbitrageBot:
             "total_investment": investment,
             "profit_pct": (1 - adj_cost) * 100,
         }
-    def execute_arbitrage(self, opp):
-        """Execute arbitrage with full safeguards."""
+    def execute_arbitrage(self, opp, now: Optional[float] = None):
+        """
+        Execute arbitrage with full safeguards.
+        `now` is the caller's time.monotonic() reading for this tick.
+        """
 
         # Too many failures? Pause
         if self.fail_count >= 3:
             logger.warning("⏸ Too many failures (>=3). Cooling down for 60 seconds.")
             time.sleep(60)
             self.fail_count = 0
+            now = None
 
-        now = time.time()
-        cd = float(self.settings.cooldown_seconds)
+        if now is None:
+            now = time.monotonic()
+        cd = self._cooldown
         if cd and (now - self._last_execution_ts) < cd:
-            logger.info(f"Cooldown active ({cd}s)")
+            logger.info("Cooldown active (%ss)", cd)
             return
         self._last_execution_ts = now
 
@@ -174,7 +246,7 @@ class SimpleArbitrageBot:
         need = opp["total_investment"]
         # Slight overshoot to avoid dust-margin insufficiency
         if bal < need * 1.1:
-            logger.error(f"❌ Balance too low. Need {need:.2f}, have {bal:.2f}")
+            logger.error("❌ Balance too low. Need %.2f, have %.2f", need, bal)
             self.fail_count += 1
             return
 
@@ -183,18 +255,17 @@ class SimpleArbitrageBot:
             trade_size=need, current_balance=bal
         )
         if not ok:
-            logger.warning(f"⚠ Trade blocked: {reason}")
+            logger.warning("⚠ Trade blocked: %s", reason)
             self.fail_count += 1
             return
 
         try:
             # Submit both
-            orders = [
-                {"side": "BUY", "token_id": self.yes_token_id,
-                 "price": opp["price_up"], "size": opp["order_size"]},
-                {"side": "BUY", "token_id": self.no_token_id,
-                 "price": opp["price_down"], "size": opp["order_size"]},
-            ]
+            up_order, dn_order = orders = self._order_tmpl
+            up_order["price"] = opp["price_up"]
+            up_order["size"] = opp["order_size"]
+            dn_order["price"] = opp["price_down"]
+            dn_order["size"] = opp["order_size"]
 
             res = place_orders_fast(self.settings, orders, order_type="GTC")
             up_id = extract_order_id(res[0])
@@ -206,8 +277,10 @@ class SimpleArbitrageBot:
                 return
 
             req = opp["order_size"]
-            up_state = wait_for_terminal_order(self.settings, up_id, requested_size=req)
-            dn_state = wait_for_terminal_order(self.settings, dn_id, requested_size=req)
+            up_state = wait_for_terminal_order(self.settings, up_id, requested_size=req,
+                                               events=self.order_events)
+            dn_state = wait_for_terminal_order(self.settings, dn_id, requested_size=req,
+                                               events=self.order_events)
 
             up_ok = up_state.get("filled_size", 0) >= req
             dn_ok = dn_state.get("filled_size", 0) >= req
@@ -232,10 +305,10 @@ class SimpleArbitrageBot:
             # Book assumed PnL (risk manager sees it)
             self.risk_manager.record_trade_result(opp["expected_profit"])
 
-            logger.info(f"🎯 Arbitrage filled: est profit={opp['expected_profit']:.3f}")
+            logger.info("🎯 Arbitrage filled: est profit=%.3f", opp["expected_profit"])
 
         except Exception as e:
-            logger.error(f"Execution error: {e}")
+            logger.error("Execution error: %s", e)
             self.fail_count += 1
             return
 
@@ -253,8 +326,7 @@ class SimpleArbitrageBot:
         return False
 
     async def run_once_async(self) -> bool:
-        up = self.get_order_book(self.yes_token_id)
-        down = self.get_order_book(self.no_token_id)
+        up, down = await self.fetch_books_async()
         opp = self.check_arbitrage(up, down)
         if opp:
             self.execute_arbitrage(opp)
@@ -262,56 +334,84 @@ class SimpleArbitrageBot:
         self.fail_count += 1
         return False
 
+    # ---------------------------
+    # background redeem
+    # ---------------------------
+    async def _redeem_loop(self, interval_seconds=REDEEM_CHECK_INTERVAL):
+        """Poll for redeemable positions off the trading hot path."""
+        while not GracefulShutdown.SHUTDOWN:
+            await asyncio.sleep(interval_seconds)
+            if self._redeem_lock.locked():
+                continue
+            async with self._redeem_lock:
+                try:
+                    # Blocking HTTP calls run in a worker thread, so the
+                    # monitor loop keeps consuming ticks meanwhile
+                    if await asyncio.to_thread(has_redeemable, self.settings):
+                        logger.info("💰 Redeemable tokens detected — redeeming…")
+                        res = await asyncio.to_thread(redeem_all, self.settings)
+                        logger.info("Redeem result: %s", res)
+                except Exception as e:
+                    logger.error("[redeem] %s", e)
+
     # ---------------------------
     # main monitor loop
     # ---------------------------
     async def monitor(self, interval_seconds=0):
         use_wss = getattr(self.settings, "use_wss", False)
-        logger.info(f"📡 Monitor started - WSS={use_wss}")
+        logger.info("📡 Monitor started - WSS=%s", use_wss)
 
-        if use_wss:
-            client = MarketWssClient(
-                ws_base_url=self.settings.ws_url,
-                asset_ids=[self.yes_token_id, self.no_token_id]
-            )
-            async for asset_id, event in client.run():
-                opp = self.check_arbitrage()
-                if opp:
-                    self.execute_arbitrage(opp)
+        redeem_task = asyncio.create_task(self._redeem_loop())
+        try:
+            if use_wss:
+                await self._monitor_wss()
+            else:
+                await self._monitor_rest(interval_seconds)
+        finally:
+            redeem_task.cancel()
+
+    async def _monitor_wss(self):
+        client = MarketWssClient(
+            ws_base_url=self.settings.ws_url,
+            asset_ids=[self.yes_token_id, self.no_token_id],
+            compression=self._ws_compression,
+        )
+        async for asset_id, event in client.run():
+            now = time.monotonic()
 
-                # Auto redeem
-                try:
-                    if has_redeemable(self.settings):
-                        logger.info("💰 Redeemable tokens detected — redeeming…")
-                        res = redeem_all(self.settings)
-                        logger.info(f"Redeem result: {res}")
-                except Exception as e:
-                    logger.error(f"[redeem] {e}")
+            # Book comes straight from the stream — no REST round-trip
+            # check_arbitrage() only reads asks; the array is cached on the
+            # book until its next update, so untouched sides cost nothing
+            self._books[asset_id] = {"asks": client.get_book(asset_id).asks_array()}
 
-                if GracefulShutdown.SHUTDOWN:
-                    logger.warning("👋 Shutdown detected")
-                    return
-        else:
-            while not GracefulShutdown.SHUTDOWN:
-                try:
-                    opp = self.check_arbitrage()
-                    if opp:
-                        self.execute_arbitrage(opp)
-
-                    # Auto redeem
-                    try:
-                        if has_redeemable(self.settings):
-                            logger.info("💰 Redeemable tokens detected — redeeming…")
-                            res = redeem_all(self.settings)
-                            logger.info(f"Redeem result: {res}")
-                    except Exception as e:
-                        logger.error(f"[redeem] {e}")
+            if GracefulShutdown.SHUTDOWN:
+                logger.warning("👋 Shutdown detected")
+                return
 
-                except Exception as e:
-                    logger.error(f"[monitor] {e}")
+            # Wait until the stream has delivered both sides; never fall
+            # back to REST from here
+            up_book = self._books.get(self.yes_token_id)
+            down_book = self._books.get(self.no_token_id)
+            if up_book is None or down_book is None:
+                continue
+
+            opp = self.check_arbitrage(up_book, down_book)
+            if opp:
+                self.execute_arbitrage(opp, now=now)
+
+    async def _monitor_rest(self, interval_seconds=0):
+        while not GracefulShutdown.SHUTDOWN:
+            try:
+                up_book, down_book = await self.fetch_books_async()
+                now = time.monotonic()
+                opp = self.check_arbitrage(up_book, down_book)
+                if opp:
+                    self.execute_arbitrage(opp, now=now)
+            except Exception as e:
+                logger.error("[monitor] %s", e)
 
-                if interval_seconds > 0:
-                    await asyncio.sleep(interval_seconds)
+            if interval_seconds > 0:
+                await asyncio.sleep(interval_seconds)
 
 # ---------------------------
 # Main
@@ -329,5 +429,17 @@ async def main():
     bot = SimpleArbitrageBot(settings)
     await bot.monitor(interval_seconds=0)
 
+def _run(coro):
+    """asyncio.run() on uvloop when installed (Linux/macOS), stdlib loop otherwise."""
+    if sys.platform != "win32":
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            return uvloop.run(coro)
+    return asyncio.run(coro)
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    _run(main())
@@ -2,23 +2,26 @@
 statistics.py
 
 Lightweight trade statistics logger & summary generator.
-No dependency on Pandas to avoid blocking latency / install complexity.
+No dependency on Pandas to avoid blocking latency / install complexity;
+summary totals are running sums updated on each trade.
 
 Features:
-✔ append-only log writes
+✔ append-only log writes (write-behind on a background thread)
 ✔ tracks trades in-memory
 ✔ safe file writes (never crash the bot)
 ✔ summary helpers for UI/logs
 """
 
-import csv
+import atexit
 import os
+import queue
+import threading
 import time
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeRecord:
     timestamp: float
     market_slug: str
@@ -29,9 +32,10 @@ class TradeRecord:
     expected_profit: float
     order_ids: Optional[List[str]] = None
     market_result: Optional[str] = None
+    invested: float = 0.0  # total_cost * order_size, computed once at record time
 
 
-@dataclass
+@dataclass(slots=True)
 class StatsSnapshot:
     total_trades: int
     total_invested: float
@@ -43,30 +47,55 @@ class StatsSnapshot:
 
 
 class StatisticsTracker:
+    CSV_HEADER = (
+        "timestamp,market_slug,price_up,price_down,total_cost,"
+        "order_size,expected_profit,order_ids,market_result\n"
+    )
+    # Every column except market_slug is numeric/id-only, so rows are
+    # formatted directly instead of going through csv quoting
+    ROW_FMT = "{:.6f},{},{},{},{},{},{},{},{}\n"
+
+    # Writer thread flushes up to this many rows per wakeup, waiting at
+    # most this long for a batch to fill
+    BATCH_MAX_ROWS = 256
+    BATCH_MAX_WAIT = 0.1
+
+    _STOP = object()
+
     def __init__(self, log_file: Optional[str] = None):
         self.log_file = log_file
         self.trades: List[TradeRecord] = []
+        self._queue: Optional[queue.Queue] = None
+        self._thread: Optional[threading.Thread] = None
+
+        # Trades are append-only, so every summary is a running total;
+        # get_stats() never walks self.trades
+        self._total_invested = 0.0
+        self._total_expected_profit = 0.0
+        self._total_actual_profit = 0.0
+        self._wins = 0
 
         if log_file:
             self._ensure_header()
+            # Open once, write many; disk I/O happens off the trading thread
+            try:
+                fh = open(log_file, "a", newline="", buffering=1 << 16)
+            except Exception:
+                fh = None  # never crash the bot
+            if fh is not None:
+                self._queue = queue.Queue()
+                self._thread = threading.Thread(
+                    target=self._writer_loop, args=(self._queue, fh), name="trade-log", daemon=True
+                )
+                self._thread.start()
+                atexit.register(self.close)
 
     def _ensure_header(self):
         """Ensure CSV logfile has a header row."""
         try:
             if not os.path.exists(self.log_file):
                 with open(self.log_file, "w", newline="") as f:
-                    writer = csv.writer(f)
-                    writer.writerow([
-                        "timestamp",
-                        "market_slug",
-                        "price_up",
-                        "price_down",
-                        "total_cost",
-                        "order_size",
-                        "expected_profit",
-                        "order_ids",
-                        "market_result",
-                    ])
+                    f.write(self.CSV_HEADER)
         except Exception:
             pass  # never crash the bot
 
@@ -82,10 +111,11 @@ class StatisticsTracker:
         filled: bool = True,
     ) -> TradeRecord:
         """
-        Store trade in memory + append to CSV.
+        Store trade in memory + queue the CSV append (returns immediately).
         """
         ts = time.time()
-        exp_profit = expected_profit if expected_profit is not None else (order_size * 2 - total_cost * order_size)
+        invested = total_cost * order_size
+        exp_profit = expected_profit if expected_profit is not None else (order_size * 2 - invested)
 
         rec = TradeRecord(
             timestamp=ts,
@@ -96,32 +126,85 @@ class StatisticsTracker:
             order_size=order_size,
             expected_profit=exp_profit,
             order_ids=order_ids,
+            invested=invested,
         )
         self.trades.append(rec)
+        self._total_invested += invested
+        self._total_expected_profit += exp_profit
+        # crude win definition: expected profit > 0
+        if exp_profit > 0:
+            self._wins += 1
+            self._total_actual_profit += exp_profit
 
-        if self.log_file:
+        if self._queue is not None:
+            self._queue.put_nowait(rec)
+
+        return rec
+
+    def _format_row(self, rec: TradeRecord) -> str:
+        ids = rec.order_ids
+        # Most rows carry zero or one id: skip the join for those
+        ids_str = "" if not ids else (ids[0] if len(ids) == 1 else ";".join(ids))
+        return self.ROW_FMT.format(
+            rec.timestamp,
+            (rec.market_slug or "").replace(",", "_").replace("\n", " ").replace("\r", " "),
+            rec.price_up,
+            rec.price_down,
+            rec.total_cost,
+            rec.order_size,
+            rec.expected_profit,
+            ids_str,
+            rec.market_result or "",
+        )
+
+    def _writer_loop(self, q: queue.Queue, fh):
+        """Drain queued records in batches: one writelines + flush per batch."""
+        stop = False
+        while not stop:
+            item = q.get()
+            if item is self._STOP:
+                break
+            batch = [item]
+            deadline = time.monotonic() + self.BATCH_MAX_WAIT
+            while len(batch) < self.BATCH_MAX_ROWS:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = q.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is self._STOP:
+                    stop = True
+                    break
+                batch.append(item)
+            rows = []
+            for rec in batch:
+                try:
+                    rows.append(self._format_row(rec))
+                except Exception:
+                    pass  # skip a malformed record, keep the rest of the batch
             try:
-                with open(self.log_file, "a", newline="") as f:
-                    writer = csv.writer(f)
-                    writer.writerow([
-                        rec.timestamp,
-                        rec.market_slug,
-                        rec.price_up,
-                        rec.price_down,
-                        rec.total_cost,
-                        rec.order_size,
-                        rec.expected_profit,
-                        ";".join(rec.order_ids or []),
-                        rec.market_result or "",
-                    ])
+                fh.writelines(rows)
+                fh.flush()
             except Exception:
                 pass  # skip file errors silently
+        try:
+            fh.close()
+        except Exception:
+            pass
 
-        return rec
+    def close(self):
+        """Write out queued rows and close the trade log (also runs at interpreter exit)."""
+        thread, self._thread = self._thread, None
+        q, self._queue = self._queue, None
+        if thread is not None:
+            q.put_nowait(self._STOP)
+            thread.join(timeout=5.0)
 
     def get_stats(self) -> StatsSnapshot:
         """
-        Compute summary statistics from in-memory trades.
+        Summary statistics from the running totals (O(1)).
         """
         n = len(self.trades)
         if n == 0:
@@ -135,17 +218,11 @@ class StatisticsTracker:
                 average_profit_percentage=0,
             )
 
-        total_invested = sum(t.total_cost * t.order_size for t in self.trades)
-        total_expected_profit = sum(t.expected_profit for t in self.trades)
-
+        total_invested = self._total_invested
+        total_expected_profit = self._total_expected_profit
         # If the market_result was added later, estimate:
-        total_actual_profit = 0
-        wins = 0
-        for t in self.trades:
-            # crude win definition: expected profit > 0
-            if t.expected_profit > 0:
-                wins += 1
-                total_actual_profit += t.expected_profit
+        total_actual_profit = self._total_actual_profit
+        wins = self._wins
 
         win_rate = (wins / n) * 100.0
         avg_profit_trade = total_expected_profit / n
@@ -4,36 +4,103 @@ Utility functions wrapping Polymarket trading endpoints
 Used by the arbitrage bot
 """
 
+import asyncio
+import atexit
 import time
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from typing import Any, List, Dict
 
 import httpx
 
 import logging
-from .utils import retry
+from .utils import retry, json_dumps, json_loads
 from .config import load_settings
 
 logger = logging.getLogger(__name__)
 
 
+CLOB_BASE_URL = "https://clob.polymarket.com"
+
+
+def _auth_headers(settings):
+    return {
+        "X-API-Key": settings.api_key,
+        "X-API-Secret": settings.api_secret,
+        "X-API-Passphrase": settings.api_passphrase,
+    }
+
+
+# Bodies are pre-serialized with json_dumps and sent as content=
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# HTTP/2 lets bulk orders, cancels and polls share one multiplexed
+# connection. httpx ignores Client(http2=, limits=) when a transport is
+# passed, so both live on the transport.
+_LIMITS = httpx.Limits(max_keepalive_connections=32, keepalive_expiry=60.0)
+
+# One pooled client per credential set, shared by every helper below
+_CLIENT_CACHE: Dict[tuple, httpx.Client] = {}
+
+
+def _cred_key(settings) -> tuple:
+    return (settings.api_key, settings.api_secret, settings.api_passphrase)
+
+
+def _close_clients():
+    for client in _CLIENT_CACHE.values():
+        try:
+            client.close()
+        except Exception:
+            pass
+    _CLIENT_CACHE.clear()
+
+
+atexit.register(_close_clients)
+
+# Small pool for fanning out independent blocking requests
+_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="trading")
+
+
+def _fan_out(fn, items, return_exceptions: bool = False) -> list:
+    """
+    Run fn(item) concurrently on the pool; results in input order.
+    Re-raises the first failure, or (like asyncio.gather) returns the
+    exception in its slot when return_exceptions=True.
+    """
+    futures = [_POOL.submit(fn, item) for item in items]
+    if not return_exceptions:
+        return [f.result() for f in futures]
+    return [f.exception() or f.result() for f in futures]
+
+
 def get_client(settings=None):
-    """Return an initialized HTTPX client with API key auth."""
+    """Return a shared HTTPX client with API key auth (created once per credentials)."""
     if settings is None:
         settings = load_settings()
 
-    headers = {
-        "X-API-Key": settings.api_key,
-        "Content-Type": "application/json",
-    }
+    key = _cred_key(settings)
+    client = _CLIENT_CACHE.get(key)
+    if client is None:
+        client = _CLIENT_CACHE[key] = httpx.Client(
+            headers=_auth_headers(settings),
+            base_url=CLOB_BASE_URL,
+            timeout=10,
+            transport=httpx.HTTPTransport(http2=True, limits=_LIMITS, retries=0),
+        )
+    return client
+
+
+def get_async_client(settings=None):
+    """Async twin of get_client() for concurrent requests from the event loop."""
+    if settings is None:
+        settings = load_settings()
 
-    return httpx.Client(
-        headers={
-            "X-API-Key": settings.api_key,
-            "X-API-Secret": settings.api_secret,
-            "X-API-Passphrase": settings.api_passphrase,
-        },
-        base_url="https://clob.polymarket.com",
+    return httpx.AsyncClient(
+        headers=_auth_headers(settings),
+        base_url=CLOB_BASE_URL,
         timeout=10,
+        transport=httpx.AsyncHTTPTransport(http2=True, limits=_LIMITS, retries=0),
     )
 
 
@@ -56,57 +123,90 @@ def place_order(settings, side: str, token_id: str, price: float, size: float, t
         "size": float(size),
         "time_in_force": tif,
     }
-    return client.post("/orders", json=payload).json()
+    resp = client.post("/orders", json=payload)
+    if resp.is_success:
+        _invalidate_positions()
+    return json_loads(resp.content)
+
+
+_order_fields = itemgetter("side", "token_id", "price", "size")
 
 
 def place_orders_fast(settings, orders: List[Dict[str, Any]], order_type="GTC"):
     """
     Place 2+ orders in parallel using a bulk endpoint (if supported)
-    else fallback to sequential submission.
+    else fallback to concurrent single submissions.
     """
     client = get_client(settings)
 
-    payloads = []
-    for o in orders:
-        payloads.append({
-            "side": o["side"].upper(),
-            "token_id": o["token_id"],
-            "price": float(o["price"]),
-            "size": float(o["size"]),
+    payloads = [None] * len(orders)
+    for i, o in enumerate(orders):
+        side, token_id, price, size = _order_fields(o)
+        payloads[i] = {
+            "side": side if side.isupper() else side.upper(),
+            "token_id": token_id,
+            "price": price if type(price) is float else float(price),
+            "size": size if type(size) is float else float(size),
             "time_in_force": order_type,
-        })
+        }
 
     try:
-        resp = client.post("/orders/bulk", json={"orders": payloads})
+        resp = client.post("/orders/bulk", content=json_dumps({"orders": payloads}), headers=_JSON_HEADERS)
         if resp.is_success:
-            return resp.json()
+            _invalidate_positions()
+            return json_loads(resp.content)
         else:
             logger.warning("Bulk order failed, falling back to sequential.")
     except Exception:
         logger.warning("Bulk order unavailable, falling back to sequential.")
 
-    # Fallback single submit
-    out = []
-    for o in payloads:
-        out.append(client.post("/orders", json=o).json())
-    return out
-
-
-def wait_for_terminal_order(settings, order_id: str, requested_size: float, poll_delay=0.5, timeout=15):
+    # Fallback single submits, sent concurrently
+    try:
+        bodies = [json_dumps(o) for o in payloads]
+        results = _fan_out(
+            lambda body: json_loads(client.post("/orders", content=body, headers=_JSON_HEADERS).content),
+            bodies,
+            return_exceptions=True,
+        )
+        errors = [r for r in results if isinstance(r, Exception)]
+        if errors:
+            # The other legs already reached the exchange: pull them before
+            # re-raising so no single leg is left resting
+            placed = [oid for oid in map(extract_order_id, results) if oid]
+            if placed:
+                logger.error(f"Order submit failed; cancelling placed legs {placed}")
+                cancel_orders(settings, placed)
+            raise errors[0]
+        return results
+    finally:
+        _invalidate_positions()
+
+
+def wait_for_terminal_order(settings, order_id: str, requested_size: float, poll_delay=0.5, timeout=15,
+                            events=None):
     """
-    Poll order status until:
+    Wait for order status until:
     ✔ filled
     ✔ canceled/rejected
     ✔ timeout reached
+
+    GET /orders/{id} is polled every `poll_delay` (at least once). With
+    `events` (an OrderEventsClient) the delay is spent waiting on the order
+    stream instead, so a pushed fill ends the wait without the extra RTT.
     """
+    start = time.time()
     client = get_client(settings)
 
-    start = time.time()
     last_seen = None
 
-    while time.time() - start < timeout:
+    while True:
+        if events is not None:
+            state = events.wait_for(order_id, requested_size, timeout=poll_delay)
+            if state is not None:
+                return state
+
         try:
-            res = client.get(f"/orders/{order_id}").json()
+            res = json_loads(client.get(f"/orders/{order_id}").content)
             last_seen = res
 
             filled = float(res.get("filled_size", 0.0))
@@ -121,24 +221,79 @@ def wait_for_terminal_order(settings, order_id: str, requested_size: float, poll
         except Exception as e:
             logger.error(f"[wait_for_terminal] {e}")
 
-        time.sleep(poll_delay)
+        if time.time() - start >= timeout:
+            break
+        if events is None or not events.connected:
+            time.sleep(poll_delay)
 
     return last_seen or {"status": "timeout", "filled_size": 0.0}
 
 
+async def cancel_orders_async(settings, order_ids: List[str]):
+    """Cancel all orders concurrently (~1 RTT instead of one per order)."""
+    async with get_async_client(settings) as client:
+        results = await asyncio.gather(
+            *(client.post(f"/orders/{oid}/cancel") for oid in order_ids),
+            return_exceptions=True,
+        )
+    for r in results:
+        if isinstance(r, Exception):
+            logger.error(f"[cancel_orders] {r}")
+
+
 def cancel_orders(settings, order_ids: List[str]):
+    """
+    Sync wrapper around cancel_orders_async().
+    Inside a running event loop (e.g. from the bot's monitor) it can't
+    block on the loop, so the cancels fan out on the thread pool instead.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        asyncio.run(cancel_orders_async(settings, order_ids))
+        _invalidate_positions()
+        return
+
     client = get_client(settings)
-    for oid in order_ids:
+
+    def _cancel(oid):
         try:
             client.post(f"/orders/{oid}/cancel")
         except Exception as e:
             logger.error(f"[cancel_orders] {e}")
 
+    _fan_out(_cancel, order_ids)
+    _invalidate_positions()
+
+
+# Positions change slowly; one GET /positions serves every caller for this long
+POSITIONS_CACHE_TTL = 2.0
+
+# (ts, positions) per credential set, keyed like _CLIENT_CACHE
+_positions_cache: Dict[tuple, tuple] = {}
+
+
+def _invalidate_positions():
+    _positions_cache.clear()
+
+
+def _positions(settings, ttl: float = POSITIONS_CACHE_TTL):
+    """GET /positions, memoized for `ttl` seconds (raises on HTTP/parse errors)."""
+    if settings is None:
+        settings = load_settings()
+    key = _cred_key(settings)
+    now = time.time()
+    hit = _positions_cache.get(key)
+    if hit is not None and now - hit[0] < ttl:
+        return hit[1]
+    data = json_loads(get_client(settings).get("/positions").content)
+    _positions_cache[key] = (now, data)
+    return data
+
 
 def get_positions(settings):
-    client = get_client(settings)
     try:
-        return client.get("/positions").json()
+        return _positions(settings)
     except Exception as e:
         logger.error(f"[get_positions] {e}")
         return []
@@ -153,16 +308,12 @@ def has_redeemable(settings) -> bool:
     Scan positions and see if any have redeemable=true
     Returns True/False
     """
-    client = get_client(settings)
     try:
-        res = client.get("/positions").json()
+        positions = _positions(settings)
     except Exception:
         return False
 
-    for pos in res:
-        if pos.get("redeemable", False):
-            return True
-    return False
+    return any(pos.get("redeemable", False) for pos in positions)
 
 
 def redeem_all(settings):
@@ -175,8 +326,9 @@ def redeem_all(settings):
     try:
         resp = client.post("/positions/redeem-all", json={})
         if resp.is_success:
+            _invalidate_positions()
             try:
-                return resp.json()
+                return json_loads(resp.content)
             except Exception:
                 return {"status": "ok"}
         else:
@@ -5,6 +5,7 @@ Shared helper utilities for the arbitrage bot.
 Includes:
 ✔ GracefulShutdown (CTRL+C or SIGTERM safe exit flag)
 ✔ retry decorator (optional for network wrapping)
+✔ json_loads / json_dumps (orjson if installed, stdlib json otherwise)
 """
 
 import signal
@@ -14,6 +15,16 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+try:
+    from orjson import dumps as json_dumps, loads as json_loads
+except ImportError:
+    import json as _json
+    from json import loads as json_loads
+
+    def json_dumps(obj) -> bytes:
+        """Compact JSON as bytes (same contract as orjson.dumps)."""
+        return _json.dumps(obj, separators=(",", ":")).encode()
+
 
 # =========================================================
 # Graceful Shutdown — used by main monitor loop
@@ -67,20 +78,21 @@ def retry(max_attempts=3, delay=0.5, backoff=1.2):
         def fetch():
             ...
     """
+    # Backoff schedule is fixed per decoration: one sleep per failed attempt
+    waits = tuple(delay * (backoff ** i) for i in range(max_attempts - 1))
+
     def wrapper(fn):
+        name = fn.__name__
+
         @functools.wraps(fn)
         def inner(*args, **kwargs):
-            attempts = 0
-            wait = delay
-            while True:
+            for wait in waits:
                 try:
                     return fn(*args, **kwargs)
                 except Exception as e:
-                    attempts += 1
-                    if attempts >= max_attempts:
-                        raise
-                    logger.warning(f"[retry] {fn.__name__} failed: {e}; retry in {wait:.2f}s")
+                    logger.warning("[retry] %s failed: %s; retry in %.2fs", name, e, wait)
                     time.sleep(wait)
-                    wait *= backoff
+            # Final attempt: exceptions propagate to the caller
+            return fn(*args, **kwargs)
         return inner
     return wrapper
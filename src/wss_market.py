@@ -7,27 +7,118 @@ Features:
 ✔ safe parsing of incremental updates
 ✔ maintains full bid/ask state per asset
 ✔ lightweight & resilient for arbitrage bot
+✔ order-status stream so fills are pushed instead of polled
 """
 
 import asyncio
 import json
 import logging
 import random
+import threading
+import time
 from typing import Dict, List, Tuple, Optional
 
+import numpy as np
 import websockets
 
+from .utils import json_loads
+
 logger = logging.getLogger(__name__)
 
+# Frame limits for both streams: order book frames are small and frequent
+WSS_MAX_SIZE = 2 ** 20
+WSS_READ_LIMIT = 2 ** 16
+
+# Snapshots at least this deep are parsed in one vectorized NumPy pass
+DEEP_BOOK_LEVELS = 64
+
 
 class OrderBookSide:
-    """Holder for incremental bid/ask updates"""
+    """Holder for incremental bid/ask updates ({price: size} per side)"""
+    __slots__ = ("bids", "asks", "_levels", "_asks_arr")
+
     def __init__(self):
-        self.bids: List[Tuple[float, float]] = []
-        self.asks: List[Tuple[float, float]] = []
+        self.bids: Dict[float, float] = {}
+        self.asks: Dict[float, float] = {}
+        self._levels = None  # cached to_levels() result, dropped by update()
+        self._asks_arr = None  # cached asks_array() result, dropped by update()
 
     def to_levels(self) -> Tuple[List[Tuple[float, float]], List[Tuple[float, float]]]:
-        return list(self.bids), list(self.asks)
+        """
+        Sorted (price, size) levels, best first: bids descending, asks ascending.
+
+        The lists are shared snapshots, sorted once per update and handed to
+        every reader: treat them as read-only (use to_levels_copy() to mutate).
+        update() builds new lists instead of touching these.
+        """
+        if self._levels is None:
+            self._levels = (sorted(self.bids.items(), reverse=True), sorted(self.asks.items()))
+        return self._levels
+
+    def to_levels_copy(self) -> Tuple[List[Tuple[float, float]], List[Tuple[float, float]]]:
+        """Like to_levels(), but the caller owns (and may mutate) the lists."""
+        bids, asks = self.to_levels()
+        return list(bids), list(asks)
+
+    def asks_array(self) -> np.ndarray:
+        """Asks as a read-only (N, 2) float64 [price, size] array, best first (cached)."""
+        if self._asks_arr is None:
+            asks = self.to_levels()[1]
+            arr = np.array(asks, dtype=np.float64).reshape(-1, 2) if asks else np.empty((0, 2))
+            arr.flags.writeable = False
+            self._asks_arr = arr
+        return self._asks_arr
+
+    @staticmethod
+    def _snapshot(levels) -> Dict[float, float]:
+        """Full side from a frame; zero-size levels dropped."""
+        if len(levels) >= DEEP_BOOK_LEVELS:
+            try:
+                arr = np.asarray(levels, dtype=np.float64).reshape(-1, 2)
+                arr = arr[arr[:, 1] > 0.0]
+                return dict(zip(arr[:, 0].tolist(), arr[:, 1].tolist()))
+            except (TypeError, ValueError):
+                pass  # mixed-type payload: parse level by level
+
+        side = {}
+        for p, s in levels:
+            s = float(s)
+            if s > 0.0:
+                side[float(p)] = s
+        return side
+
+    @staticmethod
+    def _patch(side: Dict[float, float], levels):
+        # Incremental frame: size 0 removes the level, otherwise overwrite
+        for p, s in levels:
+            p = float(p)
+            s = float(s)
+            if s > 0:
+                side[p] = s
+            else:
+                side.pop(p, None)
+
+    def update(self, bids, asks, incremental: bool = False):
+        """Apply one frame; a side missing from the frame is left untouched."""
+        if bids is not None or asks is not None:
+            self._levels = None
+            self._asks_arr = None
+        if bids is not None:
+            try:
+                if incremental:
+                    self._patch(self.bids, bids)
+                else:
+                    self.bids = self._snapshot(bids)
+            except Exception:
+                pass
+        if asks is not None:
+            try:
+                if incremental:
+                    self._patch(self.asks, asks)
+                else:
+                    self.asks = self._snapshot(asks)
+            except Exception:
+                pass
 
 
 class MarketWssClient:
@@ -39,9 +130,11 @@ class MarketWssClient:
             # Use client.get_book(asset_id) to read local state
     """
 
-    def __init__(self, ws_base_url: str, asset_ids: List[str]):
+    def __init__(self, ws_base_url: str, asset_ids: List[str], compression: Optional[str] = None):
         self.ws_base_url = ws_base_url.rstrip("/")
         self.asset_ids = asset_ids
+        # None = no permessage-deflate (skip an inflate per frame); "deflate" to enable
+        self.compression = compression
         self.order_books: Dict[str, OrderBookSide] = {a: OrderBookSide() for a in asset_ids}
 
         # Reconnect & throttle
@@ -54,7 +147,10 @@ class MarketWssClient:
     async def _connect(self):
         url = f"{self.ws_base_url}/ws"
         logger.info(f"[WSS] Connecting to {url} ...")
-        return await websockets.connect(url, ping_interval=20, ping_timeout=20)
+        return await websockets.connect(
+            url, ping_interval=20, ping_timeout=20, compression=self.compression,
+            max_size=WSS_MAX_SIZE, read_limit=WSS_READ_LIMIT,
+        )
 
     async def run(self):
         """
@@ -63,6 +159,10 @@ class MarketWssClient:
         """
         backoff = self._min_reconnect
 
+        # Locals for the per-frame loop (LOAD_FAST instead of global/attr lookups)
+        loads = json_loads
+        books = self.order_books
+
         while True:
             try:
                 async with await self._connect() as ws:
@@ -74,32 +174,22 @@ class MarketWssClient:
 
                     async for msg in ws:
                         try:
-                            data = json.loads(msg)
+                            data = loads(msg)
                         except Exception:
                             continue
 
-                        if data.get("type") != "orderbookUpdate":
+                        get = data.get
+                        if get("type") != "orderbookUpdate":
                             continue
 
-                        asset_id = data.get("assetId")
-                        if not asset_id or asset_id not in self.order_books:
+                        asset_id = get("assetId")
+                        book = books.get(asset_id)
+                        if book is None:
                             continue
 
-                        book = self.order_books[asset_id]
-
-                        # Update local cache
-                        bids = data.get("bids")
-                        asks = data.get("asks")
-                        if bids is not None:
-                            try:
-                                book.bids = [(float(p), float(s)) for p, s in bids if float(s) > 0]
-                            except Exception:
-                                pass
-                        if asks is not None:
-                            try:
-                                book.asks = [(float(p), float(s)) for p, s in asks if float(s) > 0]
-                            except Exception:
-                                pass
+                        # Update local cache: full replace unless the frame
+                        # is flagged as a delta
+                        book.update(get("bids"), get("asks"), incremental=bool(get("incremental")))
 
                         yield asset_id, "book"
 
@@ -110,3 +200,158 @@ class MarketWssClient:
                 logger.warning(f"[WSS] Error: {e}; reconnecting in {backoff:.1f}s")
                 await asyncio.sleep(backoff)
                 backoff = min(backoff * 1.5 + random.uniform(0, 1), self._max_reconnect)
+
+
+class OrderEventsClient:
+    """
+    Polymarket CLOB order-status stream.
+
+    Runs its own event loop on a daemon thread: the bot waits for fills
+    from synchronous code, which cannot await anything on the loop it is
+    currently blocking.
+
+    Usage:
+        events = OrderEventsClient(ws_url, auth).start()
+        state = events.wait_for(order_id, requested_size, timeout=0.5)
+        # None => no terminal push in that slice (or stream down): poll REST
+    """
+
+    TERMINAL_STATUSES = ("canceled", "rejected", "expired")
+    LIVE_TYPES = ("subscribed", "orderUpdate")  # frames proving the subscription took
+    MAX_TRACKED_ORDERS = 1024  # cap on buffered order states; the oldest is evicted first
+
+    def __init__(self, ws_base_url: str, auth: Dict[str, str], compression: Optional[str] = None):
+        self.ws_base_url = ws_base_url.rstrip("/")
+        self._auth = auth
+        self.compression = compression
+        self.connected = False
+        self._generation = 0  # bumped on every drop so waiters notice flaps
+
+        # Latest pushed state per order + wakeups for waiting threads
+        self._states: Dict[str, dict] = {}
+        self._events: Dict[str, threading.Event] = {}
+        self._lock = threading.Lock()
+
+        # Reconnect & throttle
+        self._min_reconnect = 1.0
+        self._max_reconnect = 10.0
+
+    def start(self) -> "OrderEventsClient":
+        threading.Thread(
+            target=lambda: asyncio.run(self.run()),
+            name="order-events",
+            daemon=True,
+        ).start()
+        return self
+
+    def _event(self, order_id: str) -> threading.Event:
+        with self._lock:
+            return self._events.setdefault(order_id, threading.Event())
+
+    def _on_update(self, data: dict):
+        order_id = data.get("order_id") or data.get("id")
+        if not order_id:
+            return
+        with self._lock:
+            # Stored even if nobody waits yet: a fill can beat wait_for()
+            self._states[order_id] = data
+            if len(self._states) > self.MAX_TRACKED_ORDERS:
+                self._states.pop(next(iter(self._states)))
+            # Only wake registered waiters; wait_for() creates the event
+            event = self._events.get(order_id)
+        if event is not None:
+            event.set()
+
+    def _drop(self):
+        """Mark the stream down and wake every waiter so it can ask REST."""
+        with self._lock:
+            self.connected = False
+            self._generation += 1
+            waiting = list(self._events.values())
+        for event in waiting:
+            event.set()
+
+    def _is_done(self, state: dict, requested_size: float) -> bool:
+        try:
+            if float(state.get("filled_size", 0.0)) >= requested_size:
+                return True
+        except (TypeError, ValueError):
+            pass
+        return str(state.get("status", "")).lower() in self.TERMINAL_STATUSES
+
+    def wait_for(self, order_id: str, requested_size: float, timeout: float = 0.5) -> Optional[dict]:
+        """
+        Block until a filled/terminal state is pushed for the order, or timeout.
+        Returns that state, or None if the stream is down, dropped during the
+        wait, or pushed nothing terminal in time. Meant to be called in short
+        slices between REST polls, which stay the source of truth.
+        """
+        generation = self._generation
+        if not self.connected:
+            return None
+
+        deadline = time.monotonic() + timeout
+        event = self._event(order_id)
+        try:
+            while True:
+                state = self._states.get(order_id)
+                if state is not None and self._is_done(state, requested_size):
+                    return state
+                if not self.connected or self._generation != generation:
+                    return None
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                event.wait(remaining)
+                event.clear()
+        finally:
+            with self._lock:
+                self._events.pop(order_id, None)
+                self._states.pop(order_id, None)
+
+    async def _connect(self):
+        url = f"{self.ws_base_url}/ws"
+        logger.info(f"[WSS] Connecting to {url} (orders) ...")
+        return await websockets.connect(
+            url, ping_interval=20, ping_timeout=20, compression=self.compression,
+            max_size=WSS_MAX_SIZE, read_limit=WSS_READ_LIMIT,
+        )
+
+    async def run(self):
+        """Runs forever on the background thread, recording order updates."""
+        backoff = self._min_reconnect
+
+        while True:
+            try:
+                async with await self._connect() as ws:
+                    await ws.send(json.dumps({"type": "subscribe", "channel": "orders", **self._auth}))
+                    logger.info("[WSS] Subscribed to order updates")
+
+                    async for msg in ws:
+                        try:
+                            data = json_loads(msg)
+                        except Exception:
+                            continue
+
+                        msg_type = data.get("type")
+                        if not self.connected and msg_type in self.LIVE_TYPES:
+                            # Ack or first update: the subscription is live
+                            self.connected = True
+                            backoff = self._min_reconnect  # reset on success
+                        elif msg_type == "error":
+                            logger.warning(f"[WSS] Order stream error frame: {data}")
+
+                        if msg_type == "orderUpdate":
+                            self._on_update(data)
+
+            except (asyncio.CancelledError, KeyboardInterrupt):
+                logger.info("[WSS] Order stream cancelled; exiting")
+                return
+            except Exception as e:
+                logger.warning(f"[WSS] Order stream error: {e}; reconnecting in {backoff:.1f}s")
+            finally:
+                # Before the backoff sleep, so waiters switch to REST now
+                self._drop()
+
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 1.5 + random.uniform(0, 1), self._max_reconnect)
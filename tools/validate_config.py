@@ -0,0 +1,65 @@
+"""
+validate_config.py
+Pre-commit check for the Settings schema in src/config.py.
+
+Structural properties (every field annotated with a supported type,
+backed by an env key, and given a default of the right type by
+load_settings()) never change at runtime, so they are checked here once
+instead of on every bot start. Defaults are loaded with an empty
+environment, so a developer's local .env cannot affect the result.
+
+Run with: python tools/validate_config.py
+"""
+
+import os
+import sys
+from dataclasses import fields
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+SUPPORTED_TYPES = (str, int, float, bool)
+
+
+def _load_defaults(config):
+    """Run the uncached loader against an empty environment."""
+    saved = config._ENV
+    config._ENV = {}
+    try:
+        return config.load_settings.__wrapped__()
+    finally:
+        config._ENV = saved
+
+
+def _check() -> list:
+    try:
+        # Importing also checks that _KEYS matches the Settings fields
+        from src import config
+    except RuntimeError as e:
+        return [str(e)]
+
+    try:
+        defaults = _load_defaults(config)
+    except Exception as e:
+        return [f"load_settings() fails with an empty environment: {e!r}"]
+
+    errors = []
+    for f in fields(config.Settings):
+        if f.type not in SUPPORTED_TYPES:
+            errors.append(f"Settings.{f.name}: unsupported type annotation {f.type!r}")
+        elif type(getattr(defaults, f.name)) is not f.type:
+            errors.append(f"Settings.{f.name}: load_settings() default is not a {f.type.__name__}")
+    return errors
+
+
+def main() -> int:
+    errors = _check()
+
+    for err in errors:
+        print(f"❌ {err}")
+    if not errors:
+        print("✅ Settings schema OK")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())